@@ -7,11 +7,17 @@ This template provides a starting point for creating MCP servers with Python.
 
 import os
 import json
-from datetime import datetime
-from typing import Any, Optional
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent, Resource
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra in pyproject.toml
+    orjson = None
+
+# mcp is imported where it is used so importing this module (config, tests) stays cheap
+if TYPE_CHECKING:
+    from mcp.types import TextContent
 
 
 class Config:
@@ -21,23 +27,36 @@ class Config:
         self.debug = os.getenv("DEBUG", "false").lower() == "true"
         # Add your configuration variables here
 
+        # Config is immutable after startup, so serialize it once (keep this last)
+        self._json = json.dumps(self.to_dict(), indent=2)
+
     def to_dict(self) -> dict:
         """Convert config to dictionary"""
         return {
             "debug": self.debug,
         }
 
+    def to_json(self) -> str:
+        """Return config as a JSON string"""
+        return self._json
+
 
 class MCPServerTemplate:
     """Main MCP Server implementation"""
 
     def __init__(self):
+        from mcp.server import Server
+
         self.config = Config()
         self.server = Server("mcp-server-template")
         self._setup_handlers()
 
     def _setup_handlers(self):
         """Setup tool and resource handlers"""
+        from mcp.types import Tool, TextContent, Resource
+
+        # Kept for _handle_example_tool so tool calls don't repeat the import
+        self._text_content = TextContent
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
@@ -86,11 +105,11 @@ class MCPServerTemplate:
         async def read_resource(uri: str) -> str:
             """Read resource content"""
             if uri == "resource://example/config":
-                return json.dumps(self.config.to_dict(), indent=2)
+                return self.config.to_json()
             else:
                 raise ValueError(f"Unknown resource: {uri}")
 
-    async def _handle_example_tool(self, args: dict) -> list[TextContent]:
+    async def _handle_example_tool(self, args: dict) -> "list[TextContent]":
         """
         Handle example tool execution
 
@@ -106,13 +125,21 @@ class MCPServerTemplate:
         result = {
             "processed": True,
             "message": args["message"],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         }
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        # Compact JSON for the wire; indentation more than doubles the bytes
+        if orjson is not None:
+            text = orjson.dumps(result).decode()
+        else:
+            text = json.dumps(result, separators=(",", ":"))
+
+        return [self._text_content(type="text", text=text)]
 
     async def run(self):
         """Start the MCP server"""
+        from mcp.server.stdio import stdio_server
+
         if self.config.debug:
             import sys
 
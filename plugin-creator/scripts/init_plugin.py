@@ -7,127 +7,29 @@ Creates plugin scaffolding from templates.
 
 import argparse
 import os
-import shutil
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 
-PLUGIN_TYPES = {
-    "mcp-ts": "MCP Server (TypeScript)",
-    "mcp-py": "MCP Server (Python)",
-    "skill": "Skill",
-    "command": "Slash Command",
-    "full": "Full Plugin (MCP + Skill + Commands)",
-}
-
-
-def get_templates_dir() -> Path:
-    """Get the templates directory path"""
-    script_dir = Path(__file__).parent
-    return script_dir.parent / "assets" / "templates"
-
-
-def create_plugin(
-    plugin_name: str, plugin_type: str, output_dir: Optional[str] = None
-) -> int:
-    """
-    Create plugin from template
-
-    Args:
-        plugin_name: Name of the plugin to create
-        plugin_type: Type of plugin (mcp-ts, mcp-py, skill, command, full)
-        output_dir: Output directory (default: current directory)
-
-    Returns:
-        Exit code (0 for success)
-    """
-    # Determine output path
-    if output_dir:
-        output_path = Path(output_dir) / plugin_name
-    else:
-        output_path = Path.cwd() / plugin_name
-
-    if output_path.exists():
-        print(f"Error: Directory already exists: {output_path}", file=sys.stderr)
-        return 1
-
-    # Get template directory
-    templates_dir = get_templates_dir()
-
-    if not templates_dir.exists():
-        print(f"Error: Templates directory not found: {templates_dir}", file=sys.stderr)
-        return 1
-
-    # Map plugin type to template directory
-    template_map = {
-        "mcp-ts": "mcp-server-typescript",
-        "mcp-py": "mcp-server-python",
-        "skill": "skill",
-        "command": "slash-command",
-        "full": "full-plugin",
+# Plugin type -> (human-readable name, template directory)
+_PLUGIN_SPECS = MappingProxyType(
+    {
+        "mcp-ts": ("MCP Server (TypeScript)", "mcp-server-typescript"),
+        "mcp-py": ("MCP Server (Python)", "mcp-server-python"),
+        "skill": ("Skill", "skill"),
+        "command": ("Slash Command", "slash-command"),
+        "full": ("Full Plugin (MCP + Skill + Commands)", "full-plugin"),
     }
+)
 
-    template_name = template_map.get(plugin_type)
-    if not template_name:
-        print(f"Error: Unknown plugin type: {plugin_type}", file=sys.stderr)
-        return 1
-
-    template_path = templates_dir / template_name
-
-    if not template_path.exists():
-        print(f"Error: Template not found: {template_path}", file=sys.stderr)
-        return 1
-
-    # Create plugin from template
-    try:
-        print(f"Creating {PLUGIN_TYPES[plugin_type]} plugin: {plugin_name}")
-        print(f"Template: {template_name}")
-        print(f"Output: {output_path}")
-
-        if plugin_type == "full":
-            # For full plugin, create structure and copy components
-            output_path.mkdir(parents=True)
-
-            print("\nCopying MCP server template (choose TypeScript or Python)...")
-            print("  Copying TypeScript version...")
-            mcp_ts_src = templates_dir / "mcp-server-typescript"
-            mcp_ts_dst = output_path / "mcp-server-typescript"
-            shutil.copytree(mcp_ts_src, mcp_ts_dst)
-
-            print("  Copying Python version...")
-            mcp_py_src = templates_dir / "mcp-server-python"
-            mcp_py_dst = output_path / "mcp-server-python"
-            shutil.copytree(mcp_py_src, mcp_py_dst)
-
-            print("\nCopying skill template...")
-            skill_src = templates_dir / "skill"
-            skill_dst = output_path / "skill"
-            shutil.copytree(skill_src, skill_dst)
-
-            print("Copying command template...")
-            command_src = templates_dir / "slash-command"
-            command_dst = output_path / "commands"
-            shutil.copytree(command_src, command_dst)
-
-            print("\nCopying full plugin README...")
-            readme_src = templates_dir / "full-plugin" / "README.md"
-            readme_dst = output_path / "README.md"
-            shutil.copy(readme_src, readme_dst)
+PLUGIN_TYPES = MappingProxyType({key: spec[0] for key, spec in _PLUGIN_SPECS.items()})
 
-        else:
-            # For single component, copy template
-            shutil.copytree(template_path, output_path)
-
-        print(f"\n✓ Plugin created successfully: {output_path}")
-
-        # Print next steps
-        print("\n" + "=" * 60)
-        print("NEXT STEPS")
-        print("=" * 60)
 
-        if plugin_type == "mcp-ts":
-            print(f"""
+# Post-creation instructions per plugin type, filled in with str.format
+NEXT_STEPS = {
+    "mcp-ts": """
 1. Install dependencies:
    cd {plugin_name}
    npm install
@@ -141,9 +43,8 @@ def create_plugin(
    npm start
 
 4. Add to Claude Code config
-""")
-        elif plugin_type == "mcp-py":
-            print(f"""
+""",
+    "mcp-py": """
 1. Install dependencies:
    cd {plugin_name}
    pip install -e .
@@ -156,9 +57,8 @@ def create_plugin(
    python -m app.main
 
 4. Add to Claude Code config
-""")
-        elif plugin_type == "skill":
-            print(f"""
+""",
+    "skill": """
 1. Customize the skill:
    cd {plugin_name}
    - Edit SKILL.md with your content
@@ -170,9 +70,8 @@ def create_plugin(
 
 3. Install:
    cp -r {plugin_name}/ ~/.claude/skills/
-""")
-        elif plugin_type == "command":
-            print(f"""
+""",
+    "command": """
 1. Customize the command:
    cd {plugin_name}
    - Rename example-command.md
@@ -183,9 +82,8 @@ def create_plugin(
 
 3. Test:
    /your-command [args]
-""")
-        elif plugin_type == "full":
-            print(f"""
+""",
+    "full": """
 1. Choose MCP server language:
    cd {plugin_name}
    - Keep either mcp-server-typescript/ OR mcp-server-python/
@@ -203,7 +101,117 @@ def create_plugin(
    - Test integration
 
 4. See README.md for detailed instructions
-""")
+""",
+}
+
+
+# Template subtrees that make up a full plugin, and where they go in it
+FULL_PLUGIN_LAYOUT = {
+    "mcp-server-typescript": "mcp-server-typescript",
+    "mcp-server-python": "mcp-server-python",
+    "skill": "skill",
+    "slash-command": "commands",
+    "full-plugin/README.md": "README.md",
+}
+
+
+# Junk that may accumulate in the template tree; never copied
+TEMPLATE_EXCLUDE_NAMES = ("__pycache__", "node_modules", ".git", ".DS_Store")
+TEMPLATE_EXCLUDE_SUFFIXES = (".pyc",)
+
+
+def get_templates_dir() -> Path:
+    """Get the templates directory path"""
+    script_dir = Path(__file__).parent
+    return script_dir.parent / "assets" / "templates"
+
+
+def create_plugin(
+    plugin_name: str, plugin_type: str, output_dir: Optional[str] = None
+) -> int:
+    """
+    Create plugin from template
+
+    Args:
+        plugin_name: Name of the plugin to create
+        plugin_type: Type of plugin (mcp-ts, mcp-py, skill, command, full)
+        output_dir: Output directory (default: current directory)
+
+    Returns:
+        Exit code (0 for success)
+    """
+    import shutil
+
+    # Determine output path
+    if output_dir:
+        output_path = Path(output_dir) / plugin_name
+    else:
+        output_path = Path.cwd() / plugin_name
+
+    spec = _PLUGIN_SPECS.get(plugin_type)
+    if spec is None:
+        print(f"Error: Unknown plugin type: {plugin_type}", file=sys.stderr)
+        return 1
+
+    human_name, template_name = spec
+
+    # Get template directory
+    templates_dir = get_templates_dir()
+    template_path = templates_dir / template_name
+
+    # A single stat covers both a missing templates dir and a missing template
+    try:
+        os.stat(template_path)
+    except FileNotFoundError:
+        print(f"Error: Template not found: {template_path}", file=sys.stderr)
+        return 1
+
+    # Creating the directory fails atomically if it already exists
+    try:
+        os.makedirs(output_path)
+    except FileExistsError:
+        print(f"Error: Directory already exists: {output_path}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Error creating plugin: {e}", file=sys.stderr)
+        return 1
+
+    # Create plugin from template
+    try:
+        print(f"Creating {human_name} plugin: {plugin_name}")
+        print(f"Template: {template_name}")
+        print(f"Output: {output_path}")
+
+        # Skip junk that may have accumulated in the template directories
+        ignore = shutil.ignore_patterns(
+            *TEMPLATE_EXCLUDE_NAMES, *(f"*{suffix}" for suffix in TEMPLATE_EXCLUDE_SUFFIXES)
+        )
+
+        if plugin_type == "full":
+            # For full plugin, copy components into the new directory
+            print("\nCopying MCP server templates (choose TypeScript or Python)...")
+            print("Copying skill and command templates...")
+            for src, dst in FULL_PLUGIN_LAYOUT.items():
+                if src != "full-plugin/README.md":
+                    shutil.copytree(templates_dir / src, output_path / dst, ignore=ignore)
+
+            print("\nCopying full plugin README...")
+            readme_src = templates_dir / "full-plugin" / "README.md"
+            readme_dst = output_path / "README.md"
+            shutil.copy(readme_src, readme_dst)
+
+        else:
+            # For single component, copy template
+            shutil.copytree(template_path, output_path, ignore=ignore, dirs_exist_ok=True)
+
+        print(f"\n✓ Plugin created successfully: {output_path}")
+
+        # Print next steps
+        print("\n" + "=" * 60)
+        print("NEXT STEPS")
+        print("=" * 60)
+
+        print(NEXT_STEPS[plugin_type].format(plugin_name=plugin_name))
 
         return 0
 
@@ -244,7 +252,7 @@ Examples:
 
     parser.add_argument(
         "--type",
-        choices=list(PLUGIN_TYPES.keys()),
+        choices=list(_PLUGIN_SPECS),
         required=True,
         help="Plugin type to create",
     )
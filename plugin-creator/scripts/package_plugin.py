@@ -6,21 +6,105 @@ Packages plugin into distributable archive with validation.
 """
 
 import argparse
+import io
+import json
 import os
-import shutil
 import sys
-import subprocess
+import time
+import zipfile
+from collections import deque
 from pathlib import Path
 from typing import Optional
-import tempfile
 
 
-def run_validation(plugin_path: Path) -> bool:
+# Records the plugin state that last passed validation (see run_validation)
+VALIDATION_CACHE_NAME = ".package-cache.json"
+
+# Patterns to exclude from the package, matched against every path component
+EXCLUDE_PATTERNS = (
+    # Version control
+    ".git",
+    ".gitignore",
+    # Dependencies
+    "node_modules",
+    "__pycache__",
+    "*.pyc",
+    ".pytest_cache",
+    # Build artifacts
+    "dist",
+    "build",
+    ".tsbuildinfo",
+    # IDE
+    ".vscode",
+    ".idea",
+    "*.swp",
+    # OS
+    ".DS_Store",
+    "Thumbs.db",
+    # Temporary
+    "*.tmp",
+    "*.log",
+    # Packaging
+    VALIDATION_CACHE_NAME,
+)
+
+# Split once so the walker does O(1) name lookups instead of a pattern loop
+_EXCLUDE_NAMES = frozenset(p for p in EXCLUDE_PATTERNS if not p.startswith("*"))
+_EXCLUDE_SUFFIXES = tuple(p[1:] for p in EXCLUDE_PATTERNS if p.startswith("*"))
+
+# Files are read on worker threads (I/O releases the GIL) while the main
+# thread compresses; larger files are streamed by zipfile instead. The
+# read-ahead window is capped both in files and in bytes held in memory
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_PREFETCH_DEPTH = _READ_WORKERS * 2
+_PREFETCH_MAX_SIZE = 8 * 1024 * 1024
+_PREFETCH_BUDGET = 32 * 1024 * 1024
+
+# Packages whose input files total less than this are assembled in memory
+_IN_MEMORY_MAX_SIZE = 200 * 1024 * 1024
+
+# Already-compressed formats are stored as-is; deflating them only burns CPU
+_STORED_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".zip",
+        ".gz",
+        ".tgz",
+        ".bz2",
+        ".xz",
+        ".whl",
+        ".mp4",
+        ".woff",
+        ".woff2",
+    }
+)
+
+
+def _validation_fingerprint(
+    plugin_path: Path, validate_script: Path, skip: Optional[Path] = None
+) -> dict:
+    """Snapshot of file mtimes that decides whether validation can be skipped"""
+    files = iter_package_files(plugin_path, skip=skip)
+    return {
+        "validator": validate_script.stat().st_mtime_ns,
+        "files": {rel: st.st_mtime_ns for _, rel, st in files},
+    }
+
+
+def run_validation(
+    plugin_path: Path, force: bool = False, skip: Optional[Path] = None
+) -> bool:
     """
     Run validation script
 
     Args:
         plugin_path: Path to plugin
+        force: Validate even if nothing changed since the last successful run
+        skip: File to leave out of the change check (the package being written)
 
     Returns:
         True if validation passes
@@ -32,82 +116,173 @@ def run_validation(plugin_path: Path) -> bool:
         print("Warning: validate_plugin.py not found, skipping validation")
         return True
 
+    cache_file = plugin_path / VALIDATION_CACHE_NAME
+    fingerprint = _validation_fingerprint(plugin_path, validate_script, skip=skip)
+
+    if not force:
+        try:
+            cached = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            cached = None
+
+        if cached == fingerprint:
+            print("Validation skipped: plugin unchanged since last successful validation")
+            print("(use --force-validation to re-run)")
+            return True
+
     print("Running validation...")
     print("=" * 60)
 
+    # Validate in-process to skip a second interpreter startup
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+
+    try:
+        import validate_plugin
+    except ImportError:
+        validate_plugin = None
+
     try:
-        result = subprocess.run(
-            [sys.executable, str(validate_script), str(plugin_path)],
-            capture_output=False,
-        )
-        return result.returncode == 0
+        if validate_plugin is not None:
+            passed = validate_plugin.main([str(plugin_path)]) == 0
+        else:
+            import subprocess
+
+            result = subprocess.run(
+                [sys.executable, str(validate_script), str(plugin_path)],
+                capture_output=False,
+            )
+            passed = result.returncode == 0
     except Exception as e:
         print(f"Error running validation: {e}")
         return False
 
+    if passed:
+        try:
+            cache_file.write_text(json.dumps(fingerprint))
+        except OSError:
+            # Read-only plugin directories just don't get the cache
+            pass
+
+    return passed
+
+
+def _is_excluded(name: str) -> bool:
+    """Check a single path component against the exclude patterns"""
+    return name in _EXCLUDE_NAMES or name.endswith(_EXCLUDE_SUFFIXES)
+
+
+def _walk(root: str, rel_dir: str, skip_path: Optional[str]):
+    """Recursively scan root, never descending into excluded directories"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if _is_excluded(entry.name):
+                continue
+
+            rel_path = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path, f"{rel_path}/", skip_path)
+            elif entry.is_file() and entry.path != skip_path:
+                yield entry.path, rel_path, entry.stat()
 
-def should_exclude(path: Path, plugin_root: Path) -> bool:
+
+def iter_package_files(plugin_path: Path, skip: Optional[Path] = None):
     """
-    Check if path should be excluded from package
+    Walk plugin directory, pruning excluded paths
 
     Args:
-        path: Path to check
-        plugin_root: Root of plugin directory
+        plugin_path: Root of plugin directory
+        skip: File to leave out (e.g. the package being written)
 
-    Returns:
-        True if should be excluded
+    Yields:
+        Tuples of (absolute file path, POSIX path relative to plugin root,
+        os.stat_result of the file)
     """
-    # Patterns to exclude
-    exclude_patterns = [
-        # Version control
-        ".git",
-        ".gitignore",
-        # Dependencies
-        "node_modules",
-        "__pycache__",
-        "*.pyc",
-        ".pytest_cache",
-        # Build artifacts
-        "dist",
-        "build",
-        ".tsbuildinfo",
-        # IDE
-        ".vscode",
-        ".idea",
-        "*.swp",
-        # OS
-        ".DS_Store",
-        "Thumbs.db",
-        # Temporary
-        "*.tmp",
-        "*.log",
-    ]
-
-    # Get relative path
-    try:
-        rel_path = path.relative_to(plugin_root)
-    except ValueError:
-        return False
+    skip_path = os.path.abspath(skip) if skip else None
+    yield from _walk(os.path.abspath(plugin_path), "", skip_path)
+
+
+def _read_file(path: str) -> bytes:
+    """Read file contents"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_entry(
+    zf: zipfile.ZipFile,
+    path: str,
+    arcname: str,
+    st: os.stat_result,
+    data: Optional[bytes],
+):
+    """Add one file to the archive, using prefetched contents when available"""
+    if os.path.splitext(arcname)[1].lower() in _STORED_EXTENSIONS:
+        compress_type = zipfile.ZIP_STORED
+    else:
+        compress_type = zf.compression
+
+    if data is None:
+        zf.write(path, arcname=arcname, compress_type=compress_type)
+        return
+
+    # Same metadata as ZipInfo.from_file, taken from the walker's cached stat
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zf.writestr(zinfo, data, compress_type=compress_type, compresslevel=zf.compresslevel)
+
 
-    # Check each part of path against patterns
-    for part in rel_path.parts:
-        for pattern in exclude_patterns:
-            if pattern.startswith("*"):
-                # Wildcard pattern
-                if part.endswith(pattern[1:]):
-                    return True
+def write_package_files(zf: zipfile.ZipFile, files: list, prefix: str):
+    """
+    Add plugin files to archive, overlapping file reads with compression
+
+    Args:
+        zf: Open archive to write to
+        files: Entries produced by iter_package_files
+        prefix: Directory name for files inside the archive
+
+    Returns:
+        Number of files written
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = deque()
+    pending_bytes = 0
+    file_count = 0
+
+    def write_next():
+        nonlocal pending_bytes, file_count
+        path, arcname, st, future = pending.popleft()
+        if future is not None:
+            pending_bytes -= st.st_size
+        _write_entry(zf, path, arcname, st, future and future.result())
+        file_count += 1
+
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+        for path, rel_path, st in files:
+            if st.st_size <= _PREFETCH_MAX_SIZE:
+                future = executor.submit(_read_file, path)
+                pending_bytes += st.st_size
             else:
-                # Exact match
-                if part == pattern:
-                    return True
+                future = None
+            pending.append((path, f"{prefix}/{rel_path}", st, future))
+
+            while pending and (
+                len(pending) >= _PREFETCH_DEPTH or pending_bytes > _PREFETCH_BUDGET
+            ):
+                write_next()
 
-    return False
+        while pending:
+            write_next()
+
+    return file_count
 
 
 def create_package(
     plugin_path: Path,
     output_dir: Optional[Path] = None,
     skip_validation: bool = False,
+    force_validation: bool = False,
 ) -> Optional[Path]:
     """
     Create plugin package
@@ -116,6 +291,8 @@ def create_package(
         plugin_path: Path to plugin directory
         output_dir: Output directory for package (default: current directory)
         skip_validation: Skip validation step
+        force_validation: Validate even if the plugin is unchanged since the
+            last successful validation
 
     Returns:
         Path to created package, or None if failed
@@ -128,14 +305,6 @@ def create_package(
         print(f"Error: Plugin path is not a directory: {plugin_path}", file=sys.stderr)
         return None
 
-    # Run validation unless skipped
-    if not skip_validation:
-        if not run_validation(plugin_path):
-            print("\nValidation failed. Use --skip-validation to package anyway.")
-            return None
-    else:
-        print("Skipping validation (--skip-validation specified)")
-
     # Determine package name
     plugin_name = plugin_path.name
     package_name = f"{plugin_name}.zip"
@@ -146,6 +315,15 @@ def create_package(
     else:
         output_path = Path.cwd() / package_name
 
+    # Run validation unless skipped; a previous package written into the
+    # plugin directory must not count as a change
+    if not skip_validation:
+        if not run_validation(plugin_path, force=force_validation, skip=output_path):
+            print("\nValidation failed. Use --skip-validation to package anyway.")
+            return None
+    else:
+        print("Skipping validation (--skip-validation specified)")
+
     if output_path.exists():
         print(f"Warning: Package already exists: {output_path}")
         response = input("Overwrite? (y/N): ")
@@ -154,72 +332,65 @@ def create_package(
             return None
         output_path.unlink()
 
-    # Create temporary directory for packaging
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir) / plugin_name
-
-        print(f"\nPreparing package: {plugin_name}")
-        print("=" * 60)
-
-        # Copy plugin files, excluding unwanted files
-        print("Copying files...")
-        copied_files = []
+    print(f"\nPreparing package: {plugin_name}")
+    print("=" * 60)
 
-        for item in plugin_path.rglob("*"):
-            if should_exclude(item, plugin_path):
-                continue
+    # Build MCP server if needed (one directory listing instead of a stat per file)
+    top_level_names = set(os.listdir(plugin_path))
 
-            if item.is_file():
-                # Calculate relative path
-                rel_path = item.relative_to(plugin_path)
-                dest_path = temp_path / rel_path
+    if "package.json" in top_level_names:
+        print("\nTypeScript MCP server detected")
+        print("Note: Include build instructions in README for users")
+        print("Or pre-build before packaging:")
+        print("  cd plugin && npm run build && cd ..")
 
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+    # pip unpacks source layouts anyway, so skip compression entirely for them
+    compression = zipfile.ZIP_DEFLATED
 
-                # Copy file
-                shutil.copy2(item, dest_path)
-                copied_files.append(str(rel_path))
+    if "pyproject.toml" in top_level_names:
+        print("\nPython MCP server detected")
+        print("Note: Include installation instructions in README for users")
+        print("Package will be installed with: pip install .")
+        print("Storing files uncompressed: larger archive, faster to build and install")
+        compression = zipfile.ZIP_STORED
 
-        print(f"Copied {len(copied_files)} files")
+    # Create package
+    print(f"\nCreating package: {output_path}")
 
-        # Build MCP server if needed
-        if (temp_path / "package.json").exists():
-            print("\nTypeScript MCP server detected")
-            print("Note: Include build instructions in README for users")
-            print("Or pre-build before packaging:")
-            print("  cd plugin && npm run build && cd ..")
+    try:
+        files = list(iter_package_files(plugin_path, skip=output_path))
 
-        if (temp_path / "pyproject.toml").exists():
-            print("\nPython MCP server detected")
-            print("Note: Include installation instructions in README for users")
-            print("Package will be installed with: pip install .")
+        # Typical packages are built in memory and written to disk in one go;
+        # very large ones are written to the file directly
+        total_size = sum(st.st_size for _, _, st in files)
+        buffer = io.BytesIO() if total_size <= _IN_MEMORY_MAX_SIZE else None
 
-        # Create package
-        print(f"\nCreating package: {output_path}")
+        # Write plugin files straight into the archive, excluding unwanted files
+        with zipfile.ZipFile(
+            buffer or output_path,
+            "w",
+            compression,
+            compresslevel=1,
+            allowZip64=True,
+        ) as zf:
+            file_count = write_package_files(zf, files, plugin_name)
 
-        try:
-            # Create zip archive
-            shutil.make_archive(
-                str(output_path.with_suffix("")),  # Base name without .zip
-                "zip",  # Format
-                temp_dir,  # Root directory
-                plugin_name,  # Base directory in archive
-            )
+        if buffer is not None:
+            output_path.write_bytes(buffer.getbuffer())
 
-            print(f"\n✓ Package created successfully: {output_path}")
+        print(f"\n✓ Package created successfully: {output_path}")
 
-            # Show package info
-            package_size = output_path.stat().st_size
-            size_mb = package_size / (1024 * 1024)
-            print(f"  Size: {size_mb:.2f} MB")
-            print(f"  Files: {len(copied_files)}")
+        # Show package info
+        package_size = output_path.stat().st_size
+        size_mb = package_size / (1024 * 1024)
+        print(f"  Size: {size_mb:.2f} MB")
+        print(f"  Files: {file_count}")
 
-            return output_path
+        return output_path
 
-        except Exception as e:
-            print(f"Error creating package: {e}", file=sys.stderr)
-            return None
+    except Exception as e:
+        print(f"Error creating package: {e}", file=sys.stderr)
+        return None
 
 
 def main():
@@ -238,11 +409,15 @@ Examples:
   # Package without validation
   python package_plugin.py my-plugin --skip-validation
 
+  # Always re-run validation (e.g. in CI)
+  python package_plugin.py my-plugin --force-validation
+
 Packaging Process:
-  1. Validates plugin (unless --skip-validation)
-  2. Copies plugin files (excludes node_modules, __pycache__, etc.)
-  3. Creates ZIP archive
-  4. Reports package information
+  1. Validates plugin (unless --skip-validation; skipped if nothing
+     changed since the last successful validation)
+  2. Writes plugin files into a ZIP archive
+     (excludes node_modules, __pycache__, etc.)
+  3. Reports package information
 """,
     )
 
@@ -263,6 +438,12 @@ Packaging Process:
         help="Skip validation before packaging",
     )
 
+    parser.add_argument(
+        "--force-validation",
+        action="store_true",
+        help="Re-run validation even if the plugin is unchanged since it last passed",
+    )
+
     args = parser.parse_args()
 
     plugin_path = Path(args.plugin_path)
@@ -271,7 +452,9 @@ Packaging Process:
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    result = create_package(plugin_path, output_dir, args.skip_validation)
+    result = create_package(
+        plugin_path, output_dir, args.skip_validation, args.force_validation
+    )
 
     if result:
         print("\n" + "=" * 60)
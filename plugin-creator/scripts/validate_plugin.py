@@ -5,24 +5,172 @@ Plugin Validation Script
 Validates plugin structure, configuration, and documentation.
 """
 
-import argparse
-import json
+import codecs
 import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
+
+# Compiled once instead of on every SKILL.md validation
+_NAME_RE = re.compile(r"^[a-z0-9-]+\Z")
+_SECOND_PERSON_RE = re.compile(r"\b(?:you|your)\b", re.IGNORECASE)
+
+# Recommended sections of SKILL.md and README.md, found in one scan. The
+# lazy "#*?" prefix also accepts deeper headings ("### Installation")
+_SECTION_RE = re.compile(
+    r"^#*?(## Purpose|## When to Use|## Installation|## Usage)", re.MULTILINE
+)
+
+# README title marker; as before, any "# " in the text satisfies it
+_TITLE_MARKER = "# "
+
+# Top-level entries that mark an MCP server component
+_MCP_MARKERS = ("package.json", "pyproject.toml", "mcp-server")
+
+# Length, frontmatter and section checks only need the start of a document
+_HEAD_LIMIT = 64 * 1024
+
+# Heads already read in this process, keyed by file identity and limit.
+# Only multi-plugin runs enable it (see validate_one); a single validation
+# never rereads a file, so it would just cost an extra stat per document
+_HEAD_CACHE: Optional[Dict[Tuple[int, int, int, int, int], Tuple[str, bool]]] = None
+_HEAD_CACHE_SIZE = 256
+
+
+def _read_head(path: Path, limit: int = _HEAD_LIMIT) -> Tuple[str, bool]:
+    """
+    Read the start of a text file
+
+    When the head cache is enabled, results are memoized per file
+    identity, so documents shared between plugins (symlinks, hard links)
+    are read once per process.
+
+    Args:
+        path: File to read
+        limit: Maximum number of bytes to read
+
+    Returns:
+        Tuple of (decoded text, True if the file is longer than limit)
+    """
+    cache = _HEAD_CACHE
+    if cache is None:
+        return _decode_head(path, limit)
+
+    st = os.stat(path)
+    # A changed mtime or size gives a new key, so stale entries are never hit
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, limit)
+    result = cache.get(key)
+    if result is None:
+        result = _decode_head(path, limit)
+        if len(cache) >= _HEAD_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        cache[key] = result
+    return result
+
+
+def _decode_head(path: Path, limit: int) -> Tuple[str, bool]:
+    """Uncached body of _read_head"""
+    with open(path, "rb") as f:
+        data = f.read(limit + 1)
+    truncated = len(data) > limit
+    # Strict decoding still reports invalid files; only a multibyte
+    # character cut at the limit is left incomplete
+    text = codecs.getincrementaldecoder("utf-8")().decode(
+        data[:limit], final=not truncated
+    )
+    return text, truncated
+
+
+def _read_text(path: Path) -> str:
+    """Read a whole text file, decoded strictly as UTF-8 like _read_head"""
+    return path.read_bytes().decode("utf-8")
+
+
+def _missing_sections(text: str, sections: List[str]) -> List[str]:
+    """
+    Find recommended section markers that no Markdown heading in text starts with
+
+    A single _SECTION_RE scan finds every named section present, so the
+    document is read once however many sections are checked.
+    """
+    found = {m.group(1) for m in _SECTION_RE.finditer(text)}
+    if _TITLE_MARKER in sections and _TITLE_MARKER in text:
+        found.add(_TITLE_MARKER)
+    return [s for s in sections if s not in found]
+
+
+def _parse_frontmatter(frontmatter: str) -> Dict[str, str]:
+    """
+    Parse SKILL.md frontmatter into a dict of top-level string fields
+
+    A single line scan covers the usual "key: value" frontmatter, and
+    folds indented continuation lines into a plain value the way YAML
+    does. Frontmatter with indented lines, empty values or block scalars
+    ("|", ">") is re-read with PyYAML when it is installed.
+
+    Args:
+        frontmatter: Text between the frontmatter delimiters
+
+    Returns:
+        Dict of field name to stripped value (first occurrence wins)
+    """
+    fields: Dict[str, str] = {}
+    # Top-level key whose unquoted value may continue on the next lines
+    plain_key: Optional[str] = None
+    multiline = False
+    for line in frontmatter.splitlines():
+        indented = line[:1] in (" ", "\t")
+        if indented and line.strip():
+            multiline = True
+            if plain_key is not None and ":" not in line:
+                fields[plain_key] += " " + line.strip()
+                continue
+
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if key in fields:
+            plain_key = None
+            continue
+        fields[key] = value
+        plain_key = key if not indented and value and value[0] not in "|>\"'" else None
+
+    if multiline or any(not v or v[0] in "|>" for v in fields.values()):
+        # PyYAML is only imported for frontmatter the line scan cannot handle
+        try:
+            import yaml  # type: ignore[import-untyped]
+        except ImportError:
+            return fields
+
+        # Prefer the libyaml-backed loader when available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            data = yaml.load(frontmatter, Loader=loader)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, str):
+                    fields[str(key)] = value.strip()
+
+    return fields
 
 
 class ValidationError:
     """Validation error information"""
 
-    def __init__(self, severity: str, message: str, file: Optional[str] = None):
+    __slots__ = ("severity", "message", "file")
+
+    def __init__(self, severity: str, message: str, file: Optional[str] = None) -> None:
         self.severity = severity  # 'error', 'warning', 'info'
         self.message = message
         self.file = file
 
-    def __str__(self):
+    def __str__(self) -> str:
         prefix = {
             "error": "❌ ERROR",
             "warning": "⚠️  WARNING",
@@ -37,13 +185,27 @@ class ValidationError:
 class PluginValidator:
     """Plugin validation logic"""
 
-    def __init__(self, plugin_path: Path):
+    def __init__(self, plugin_path: Path) -> None:
         self.plugin_path = plugin_path
         self.errors: List[ValidationError] = []
-
-    def add_error(self, severity: str, message: str, file: Optional[str] = None):
+        # The same issues partitioned by severity as they are added
+        self._by_severity: Dict[str, List[ValidationError]] = {
+            "error": [],
+            "warning": [],
+            "info": [],
+        }
+        # Top-level directory entries, filled once by _scan_top()
+        self._top: Dict[str, os.DirEntry] = {}
+        # The same entries keyed by lowercased name, for case-insensitive filesystems
+        self._top_folded: Dict[str, os.DirEntry] = {}
+        # Location of SKILL.md, resolved by _scan_top() for detection and validation
+        self._skill_md: Optional[Path] = None
+
+    def add_error(self, severity: str, message: str, file: Optional[str] = None) -> None:
         """Add validation error"""
-        self.errors.append(ValidationError(severity, message, file))
+        error = ValidationError(severity, message, file)
+        self.errors.append(error)
+        self._by_severity[severity].append(error)
 
     def validate(self) -> bool:
         """
@@ -60,10 +222,10 @@ class PluginValidator:
             self.add_error("error", f"Plugin path is not a directory: {self.plugin_path}")
             return False
 
+        self._scan_top()
+
         # Detect plugin type and validate accordingly
-        has_mcp = self._has_mcp_server()
-        has_skill = self._has_skill()
-        has_commands = self._has_commands()
+        has_mcp, has_skill, has_commands = self._detect_components()
 
         if not (has_mcp or has_skill or has_commands):
             self.add_error(
@@ -84,56 +246,116 @@ class PluginValidator:
         self._validate_documentation()
 
         # Return True if no errors (warnings are ok)
-        return not any(e.severity == "error" for e in self.errors)
-
-    def _has_mcp_server(self) -> bool:
-        """Check if plugin has MCP server component"""
-        mcp_indicators = [
-            self.plugin_path / "package.json",
-            self.plugin_path / "pyproject.toml",
-            self.plugin_path / "src" / "index.ts",
-            self.plugin_path / "app" / "main.py",
-            self.plugin_path / "mcp-server",
-        ]
-        return any(p.exists() for p in mcp_indicators)
-
-    def _has_skill(self) -> bool:
-        """Check if plugin has skill component"""
-        skill_indicators = [
-            self.plugin_path / "SKILL.md",
-            self.plugin_path / "skill" / "SKILL.md",
-        ]
-        return any(p.exists() for p in skill_indicators)
-
-    def _has_commands(self) -> bool:
-        """Check if plugin has command components"""
-        commands_indicators = [
-            self.plugin_path / "commands",
-        ]
-        if any(p.exists() for p in commands_indicators):
-            return True
-
-        # Check for .md files that might be commands
-        md_files = list(self.plugin_path.glob("*.md"))
-        return len(md_files) > 1  # More than just README
-
-    def _validate_mcp_server(self):
+        return not self._by_severity["error"]
+
+    def _scan_top(self) -> None:
+        """Cache the plugin's top-level entries so existence checks need no stat"""
+        with os.scandir(self.plugin_path) as entries:
+            self._top = {entry.name: entry for entry in entries}
+        self._top_folded = {name.lower(): entry for name, entry in self._top.items()}
+        self._skill_md = self._find_skill_md()
+
+    def _entry(self, name: str) -> Optional[os.DirEntry]:
+        """
+        Look up a top-level entry the way Path.exists() would resolve it
+
+        An exact match needs no syscall. A match differing only in case is
+        confirmed with the filesystem, so "readme.md" satisfies "README.md"
+        on case-insensitive filesystems (macOS, Windows) but not elsewhere.
+        """
+        entry = self._top.get(name)
+        if entry is None:
+            entry = self._top_folded.get(name.lower())
+            if entry is not None and not os.path.exists(
+                os.path.join(self.plugin_path, name)
+            ):
+                entry = None
+        return entry
+
+    def _has(self, name: str) -> bool:
+        """Check if plugin has a top-level entry (uses the scan cache)"""
+        return self._entry(name) is not None
+
+    def _has_dir(self, name: str) -> bool:
+        """Check if plugin has a top-level directory (uses the scan cache)"""
+        entry = self._entry(name)
+        return entry is not None and entry.is_dir()
+
+    def _has_nested_file(self, dirname: str, filename: str) -> bool:
+        """Check for dirname/filename, probing only if dirname was scanned"""
+        entry = self._entry(dirname)
+        # Plain os.path avoids building Path objects on this hot path
+        return (
+            entry is not None
+            and entry.is_dir()
+            and os.path.isfile(os.path.join(entry.path, filename))
+        )
+
+    def _find_skill_md(self) -> Optional[Path]:
+        """Locate SKILL.md at the plugin root or in skill/"""
+        if self._has("SKILL.md"):
+            return self.plugin_path / "SKILL.md"
+        if self._has_nested_file("skill", "SKILL.md"):
+            return self.plugin_path / "skill" / "SKILL.md"
+        return None
+
+    def _detect_components(self) -> Tuple[bool, bool, bool]:
+        """
+        Detect plugin components from the cached top-level entries
+
+        Returns:
+            Tuple of (has MCP server, has skill, has commands)
+        """
+        has_mcp = any(self._has(marker) for marker in _MCP_MARKERS)
+        has_commands = self._has("commands")
+
+        if not has_commands:
+            # .md files might be commands if there is more than just README,
+            # so stop counting at the second one
+            md_count = 0
+            for name in self._top:
+                if name.endswith(".md"):
+                    md_count += 1
+                    if md_count > 1:
+                        has_commands = True
+                        break
+
+        # Nested entry points are only probed when their directory exists
+        if not has_mcp:
+            has_mcp = self._has_nested_file("src", "index.ts") or self._has_nested_file(
+                "app", "main.py"
+            )
+
+        return has_mcp, self._skill_md is not None, has_commands
+
+    def _validate_mcp_server(self) -> None:
         """Validate MCP server component"""
         # Check for TypeScript MCP server
-        if (self.plugin_path / "package.json").exists():
+        if self._has("package.json"):
             self._validate_typescript_mcp()
 
         # Check for Python MCP server
-        if (self.plugin_path / "pyproject.toml").exists():
+        if self._has("pyproject.toml"):
             self._validate_python_mcp()
 
-    def _validate_typescript_mcp(self):
+    def _validate_typescript_mcp(self) -> None:
         """Validate TypeScript MCP server"""
         package_json = self.plugin_path / "package.json"
 
+        # Imported here so plugins without a package.json never pay for them;
+        # orjson's JSONDecodeError subclasses json.JSONDecodeError
+        import json
+
+        json_loads: Callable[[bytes], Any]
         try:
-            with open(package_json) as f:
-                pkg = json.load(f)
+            import orjson
+
+            json_loads = orjson.loads
+        except ImportError:
+            json_loads = json.loads
+
+        try:
+            pkg = json_loads(package_json.read_bytes())
 
             # Check required fields
             if "name" not in pkg:
@@ -167,152 +389,178 @@ class PluginValidator:
             self.add_error("error", f"Error reading package.json: {e}", "package.json")
 
         # Check for source files
-        src_dir = self.plugin_path / "src"
-        if not src_dir.exists():
+        if not self._has("src"):
             self.add_error("error", "Missing src/ directory")
-        elif not (src_dir / "index.ts").exists():
+        elif not self._has_nested_file("src", "index.ts"):
             self.add_error("warning", "Missing src/index.ts entry point")
 
         # Check for tsconfig
-        if not (self.plugin_path / "tsconfig.json").exists():
+        if not self._has("tsconfig.json"):
             self.add_error("warning", "Missing tsconfig.json")
 
-    def _validate_python_mcp(self):
+    def _validate_python_mcp(self) -> None:
         """Validate Python MCP server"""
         pyproject = self.plugin_path / "pyproject.toml"
 
-        if not pyproject.exists():
+        if not self._has("pyproject.toml"):
             return
 
+        # tomllib is only needed here, so import it on first use
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib  # type: ignore[no-redef, import-not-found]
+            except ImportError:
+                tomllib = None  # type: ignore[assignment]
+
         try:
             content = pyproject.read_text()
 
-            # Basic TOML validation (not comprehensive)
-            if "[project]" not in content:
+            if tomllib is not None:
+                data = tomllib.loads(content)
+                has_project = "project" in data
+
+                project = data.get("project", {})
+                deps = list(project.get("dependencies", []))
+                for extra in project.get("optional-dependencies", {}).values():
+                    deps.extend(extra)
+                has_mcp = any("mcp" in dep for dep in deps)
+            else:
+                # Basic TOML validation (not comprehensive)
+                has_project = "[project]" in content
+                has_mcp = "mcp" in content
+
+            if not has_project:
                 self.add_error("error", "Missing [project] section", "pyproject.toml")
 
-            if "mcp" not in content:
+            if not has_mcp:
                 self.add_error(
                     "warning",
                     "MCP dependency not found in pyproject.toml",
                     "pyproject.toml",
                 )
 
+        except getattr(tomllib, "TOMLDecodeError", ()) as e:
+            self.add_error("error", f"Invalid TOML format: {e}", "pyproject.toml")
         except Exception as e:
             self.add_error("error", f"Error reading pyproject.toml: {e}", "pyproject.toml")
 
         # Check for app directory
-        app_dir = self.plugin_path / "app"
-        if not app_dir.exists():
+        if not self._has("app"):
             self.add_error("error", "Missing app/ directory")
-        elif not (app_dir / "main.py").exists():
+        elif not self._has_nested_file("app", "main.py"):
             self.add_error("warning", "Missing app/main.py entry point")
 
-    def _validate_skill(self):
+    def _validate_skill(self) -> None:
         """Validate skill component"""
-        # Find SKILL.md
-        skill_md_paths = [
-            self.plugin_path / "SKILL.md",
-            self.plugin_path / "skill" / "SKILL.md",
-        ]
-
-        skill_md = None
-        for path in skill_md_paths:
-            if path.exists():
-                skill_md = path
-                break
+        skill_md = self._skill_md
 
         if not skill_md:
             self.add_error("error", "SKILL.md not found")
             return
 
+        skill_md_str = str(skill_md)
+
         try:
-            content = skill_md.read_text()
+            content, truncated = _read_head(skill_md)
 
             # Check for YAML frontmatter
             if not content.startswith("---"):
-                self.add_error("error", "Missing YAML frontmatter", str(skill_md))
+                self.add_error("error", "Missing YAML frontmatter", skill_md_str)
                 return
 
-            # Extract frontmatter
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                self.add_error("error", "Invalid YAML frontmatter format", str(skill_md))
+            # Locate the closing delimiter instead of splitting the whole file
+            end = content.find("\n---", 3)
+            if end < 0 and truncated:
+                content, truncated = _read_text(skill_md), False
+                end = content.find("\n---", 3)
+            if end < 0:
+                self.add_error("error", "Invalid YAML frontmatter format", skill_md_str)
                 return
 
-            frontmatter = parts[1]
-            body = parts[2]
+            frontmatter = content[3:end]
+            body_start = end + 4
+            body = content[body_start:]
 
-            # Check for required fields
-            if "name:" not in frontmatter:
-                self.add_error("error", "Missing 'name' in frontmatter", str(skill_md))
+            fields = _parse_frontmatter(frontmatter)
+            name = fields.get("name")
+            desc = fields.get("description")
 
-            if "description:" not in frontmatter:
-                self.add_error("error", "Missing 'description' in frontmatter", str(skill_md))
+            # Check for required fields
+            if name is None:
+                self.add_error("error", "Missing 'name' in frontmatter", skill_md_str)
 
-            # Extract name and description
-            name_match = re.search(r"name:\s*(.+)", frontmatter)
-            desc_match = re.search(r"description:\s*(.+)", frontmatter)
+            if desc is None:
+                self.add_error("error", "Missing 'description' in frontmatter", skill_md_str)
 
-            if name_match:
-                name = name_match.group(1).strip()
+            if name is not None:
                 # Check naming convention
-                if not re.match(r"^[a-z0-9-]+$", name):
+                if not _NAME_RE.match(name):
                     self.add_error(
                         "warning",
                         f"Name should be lowercase-with-dashes: {name}",
-                        str(skill_md),
+                        skill_md_str,
                     )
 
-            if desc_match:
-                desc = desc_match.group(1).strip()
+            if desc is not None:
                 # Check description quality
                 if len(desc) < 20:
                     self.add_error(
                         "warning",
                         "Description is too short (should be 1-3 sentences)",
-                        str(skill_md),
+                        skill_md_str,
                     )
 
                 # Check for second person (should use third person)
-                if re.search(r"\byou\b|\byour\b", desc.lower()):
+                if _SECOND_PERSON_RE.search(desc):
                     self.add_error(
                         "warning",
                         "Description uses second person (prefer third person)",
-                        str(skill_md),
+                        skill_md_str,
                     )
 
-            # Check body has content
-            if len(body.strip()) < 100:
+            # Check body has content (a truncated read is long enough already)
+            if not truncated and len(body.strip()) < 100:
                 self.add_error(
                     "warning",
                     "Skill body is very short (add more content)",
-                    str(skill_md),
+                    skill_md_str,
                 )
 
             # Check for recommended sections
-            recommended_sections = [
-                ("## Purpose", "Purpose section"),
-                ("## When to Use", "When to Use section"),
-            ]
+            recommended_sections = {
+                "## Purpose": "Purpose section",
+                "## When to Use": "When to Use section",
+            }
+
+            missing = _missing_sections(body, list(recommended_sections))
 
-            for pattern, name in recommended_sections:
-                if pattern not in body:
-                    self.add_error("info", f"Missing recommended {name}", str(skill_md))
+            # Only read the whole file if a section is not in the first chunk
+            if missing and truncated:
+                body = _read_text(skill_md)[body_start:]
+                missing = _missing_sections(body, missing)
+
+            for pattern in missing:
+                self.add_error(
+                    "info", f"Missing recommended {recommended_sections[pattern]}", skill_md_str
+                )
 
         except Exception as e:
-            self.add_error("error", f"Error reading SKILL.md: {e}", str(skill_md))
+            self.add_error("error", f"Error reading SKILL.md: {e}", skill_md_str)
 
-    def _validate_commands(self):
+    def _validate_commands(self) -> None:
         """Validate slash commands"""
         commands_dir = self.plugin_path / "commands"
 
-        if commands_dir.exists():
+        if self._has("commands"):
             command_files = list(commands_dir.glob("*.md"))
         else:
-            # Check for .md files in root (excluding README)
+            # Check for .md files in root (excluding README), reusing the scan
             command_files = [
-                f for f in self.plugin_path.glob("*.md") if f.name.lower() != "readme.md"
+                Path(entry.path)
+                for name, entry in self._top.items()
+                if name.endswith(".md") and name.lower() != "readme.md"
             ]
 
         if not command_files:
@@ -321,38 +569,38 @@ class PluginValidator:
 
         for cmd_file in command_files:
             try:
-                content = cmd_file.read_text()
+                content, truncated = _read_head(cmd_file)
+                if truncated and "## Prompt" not in content:
+                    content, truncated = _read_text(cmd_file), False
 
                 # Check for required sections
                 if "## Prompt" not in content:
-                    self.add_error(
-                        "error", "Missing ## Prompt section", str(cmd_file.name)
-                    )
+                    self.add_error("error", "Missing ## Prompt section", cmd_file.name)
 
                 # Check command has content
-                if len(content.strip()) < 50:
+                if not truncated and len(content.strip()) < 50:
                     self.add_error(
                         "warning",
                         "Command file is very short",
-                        str(cmd_file.name),
+                        cmd_file.name,
                     )
 
             except Exception as e:
-                self.add_error("error", f"Error reading command file: {e}", str(cmd_file.name))
+                self.add_error("error", f"Error reading command file: {e}", cmd_file.name)
 
-    def _validate_documentation(self):
+    def _validate_documentation(self) -> None:
         """Validate documentation"""
         readme = self.plugin_path / "README.md"
 
-        if not readme.exists():
+        if not self._has("README.md"):
             self.add_error("warning", "Missing README.md")
             return
 
         try:
-            content = readme.read_text()
+            content, truncated = _read_head(readme)
 
             # Check README has reasonable content
-            if len(content.strip()) < 100:
+            if not truncated and len(content.strip()) < 100:
                 self.add_error("warning", "README.md is very short", "README.md")
 
             # Check for recommended sections
@@ -362,75 +610,139 @@ class PluginValidator:
                 "## Usage",
             ]
 
-            for section in recommended:
-                if section not in content:
-                    self.add_error(
-                        "info",
-                        f"README missing recommended section: {section}",
-                        "README.md",
-                    )
+            missing = _missing_sections(content, recommended)
+
+            # Only read the whole file if a section is not in the first chunk
+            if missing and truncated:
+                missing = _missing_sections(_read_text(readme), missing)
+
+            for section in missing:
+                self.add_error(
+                    "info",
+                    f"README missing recommended section: {section}",
+                    "README.md",
+                )
 
         except Exception as e:
             self.add_error("error", f"Error reading README.md: {e}", "README.md")
 
-    def print_results(self):
+    def print_results(self) -> None:
         """Print validation results"""
         if not self.errors:
             print("✓ Validation passed! No issues found.")
             return
 
-        # Group by severity
-        errors = [e for e in self.errors if e.severity == "error"]
-        warnings = [e for e in self.errors if e.severity == "warning"]
-        infos = [e for e in self.errors if e.severity == "info"]
+        errors = self._by_severity["error"]
+        warnings = self._by_severity["warning"]
+        infos = self._by_severity["info"]
 
-        if errors:
-            print("\nERRORS:")
-            for error in errors:
-                print(f"  {error}")
-
-        if warnings:
-            print("\nWARNINGS:")
-            for warning in warnings:
-                print(f"  {warning}")
-
-        if infos:
-            print("\nINFO:")
-            for info in infos:
-                print(f"  {info}")
+        # Collect the report and write it in one call
+        out: List[str] = []
+        for title, group in (("ERRORS", errors), ("WARNINGS", warnings), ("INFO", infos)):
+            if group:
+                out.append(f"\n{title}:")
+                out.extend(f"  {issue}" for issue in group)
 
         # Summary
-        print("\n" + "=" * 60)
-        print(f"Errors: {len(errors)} | Warnings: {len(warnings)} | Info: {len(infos)}")
+        out.append("\n" + "=" * 60)
+        out.append(f"Errors: {len(errors)} | Warnings: {len(warnings)} | Info: {len(infos)}")
 
         if errors:
-            print("\n❌ Validation FAILED - fix errors before packaging")
+            out.append("\n❌ Validation FAILED - fix errors before packaging")
         else:
-            print("\n⚠️  Validation passed with warnings")
+            out.append("\n⚠️  Validation passed with warnings")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def validate_one(plugin_path: str) -> Tuple[str, bool, str]:
+    """
+    Validate a single plugin and capture its report
+
+    Args:
+        plugin_path: Path to plugin directory
+
+    Returns:
+        Tuple of (plugin path, True if validation passed, printable report)
+    """
+    import contextlib
+    import io
 
+    # Worker processes validate many plugins, so shared documents pay off
+    global _HEAD_CACHE
+    if _HEAD_CACHE is None:
+        _HEAD_CACHE = {}
+
+    report = io.StringIO()
+
+    with contextlib.redirect_stdout(report):
+        print(f"Validating plugin: {plugin_path}")
+        print("=" * 60)
+
+        validator = PluginValidator(Path(plugin_path))
+        success = validator.validate()
+        validator.print_results()
+
+    return plugin_path, success, report.getvalue()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 if all plugins pass validation)
+    """
+    # Only the CLI needs argparse; library use of PluginValidator skips it
+    import argparse
 
-def main():
-    """Main entry point"""
     parser = argparse.ArgumentParser(
         description="Validate Claude Code plugin structure and configuration"
     )
 
     parser.add_argument(
-        "plugin_path", help="Path to plugin directory to validate"
+        "plugin_path", nargs="+", help="Path(s) to plugin directories to validate"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    plugin_path = Path(args.plugin_path)
+    if len(args.plugin_path) == 1:
+        plugin_path = Path(args.plugin_path[0])
 
-    print(f"Validating plugin: {plugin_path}")
-    print("=" * 60)
+        print(f"Validating plugin: {plugin_path}")
+        print("=" * 60)
+
+        validator = PluginValidator(plugin_path)
+        success = validator.validate()
+        validator.print_results()
+
+        return 0 if success else 1
+
+    # Plugins are independent, so validate them in parallel worker processes
+    from concurrent.futures import ProcessPoolExecutor
 
-    validator = PluginValidator(plugin_path)
-    success = validator.validate()
-    validator.print_results()
+    workers = min(len(args.plugin_path), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(validate_one, args.plugin_path))
+
+    failed: List[str] = []
+    for result_path, passed, report in results:
+        print(report)
+        if not passed:
+            failed.append(result_path)
+
+    print("=" * 60)
+    print(
+        f"Validated {len(results)} plugins: "
+        f"{len(results) - len(failed)} passed, {len(failed)} failed"
+    )
+    for result_path in failed:
+        print(f"  ❌ {result_path}")
 
-    return 0 if success else 1
+    return 0 if not failed else 1
 
 
 if __name__ == "__main__":